@@ -1,15 +1,40 @@
 from enum import Enum
-from typing import Self
+from functools import cache
+from typing import Iterable, Self, cast
 
 
 class ArgEnum(Enum):
     @classmethod
-    def from_arg(cls, s: str) -> Self:
-        for member in cls:
-            if member.arg == s:
-                return member
-        raise ValueError(f"invalid value '{s}'")
+    def from_arg(cls, s: str, ignore_case: bool = False, aliases: bool = False) -> Self:
+        lookup = _arg_lookup(cls, ignore_case=ignore_case, aliases=aliases)
+        try:
+            return cast(Self, lookup[s.lower() if ignore_case else s])
+        except KeyError:
+            raise ValueError(f"invalid value '{s}'") from None
+
+    @classmethod
+    def from_args(cls, ss: Iterable[str], ignore_case: bool = False, aliases: bool = False) -> list[Self]:
+        lookup = _arg_lookup(cls, ignore_case=ignore_case, aliases=aliases)
+        result: list[Self] = []
+        for s in ss:
+            try:
+                result.append(cast(Self, lookup[s.lower() if ignore_case else s]))
+            except KeyError:
+                raise ValueError(f"invalid value '{s}'") from None
+        return result
 
     @property
     def arg(self) -> str:
         return self.name.lower()
+
+
+@cache
+def _arg_lookup(cls: type[ArgEnum], ignore_case: bool, aliases: bool) -> dict[str, ArgEnum]:
+    lookup: dict[str, ArgEnum] = {}
+    for member in cls:
+        lookup.setdefault(member.arg.lower() if ignore_case else member.arg, member)
+    if aliases:
+        for name, member in cls.__members__.items():
+            if name != member.name:
+                lookup.setdefault(name.lower(), member)
+    return lookup
@@ -0,0 +1,131 @@
+from argparse import BooleanOptionalAction
+from contextlib import redirect_stderr
+from importlib import import_module
+from pathlib import Path
+from rpycli.benchmarks.suite import \
+    BENCHMARKS, \
+    find_regressions, \
+    read_baseline, \
+    run_benchmarks, \
+    write_results
+from rpycli.cli import ArgumentParser, path
+from rpycli.init import call_main
+import os
+
+
+DEFAULT_BASELINE_FILE_NAME: str = "bench_baseline.json"
+
+
+BENCHMARK_MODULES: list[str] = [
+    "rpycli.benchmarks.cli",
+    "rpycli.benchmarks.context",
+    "rpycli.benchmarks.cprint",
+    "rpycli.benchmarks.fs",
+    "rpycli.benchmarks.invoke",
+    "rpycli.benchmarks.logger",
+    "rpycli.benchmarks.proc",
+    "rpycli.benchmarks.time_util",
+]
+
+
+def load_benchmarks() -> None:
+    for name in BENCHMARK_MODULES:
+        import_module(name)
+
+
+def select_names(filters: list[str]) -> list[str]:
+    return [
+        name
+        for name in sorted(BENCHMARKS.keys())
+        if len(filters) == 0 or any(f in name for f in filters)
+    ]
+
+
+def do_list(filters: list[str]) -> None:
+    for name in select_names(filters):
+        print(name)
+
+
+def do_run(filters: list[str], repeat: int, output_path: Path | None, baseline_path: Path, tolerance: float, update_baseline: bool) -> bool:
+    names = select_names(filters)
+    if len(names) == 0:
+        print("No benchmarks selected")
+        return False
+
+    with open(os.devnull, "wt") as f, redirect_stderr(f):
+        results = run_benchmarks(names, repeat=repeat)
+
+    for result in results:
+        print(f"{result.name}: {result.ops_per_sec:,.0f} ops/s")
+
+    if output_path is not None:
+        write_results(output_path, results)
+
+    if update_baseline or not baseline_path.is_file():
+        write_results(baseline_path, results)
+        print(f"Baseline written to {baseline_path}")
+        return True
+
+    regressions = find_regressions(
+        results,
+        baseline=read_baseline(baseline_path),
+        tolerance=tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION: {regression.name}: "
+            f"{regression.ops_per_sec:,.0f} ops/s vs baseline "
+            f"{regression.baseline_ops_per_sec:,.0f} ops/s "
+            f"({regression.ratio:.0%})")
+
+    return len(regressions) == 0
+
+
+def main(cwd: Path, argv: list[str]) -> None:
+    def path_arg(s: str) -> Path:
+        return path(cwd, s)
+
+    load_benchmarks()
+
+    parser = ArgumentParser(prog="rpycli.benchmarks")
+
+    p = parser.add_command("list", help="list benchmarks", func=do_list)
+    p.add_argument("filters", nargs="*", help="benchmark name filters")
+
+    p = parser.add_command("run", help="run benchmarks", func=do_run)
+    p.add_argument("filters", nargs="*", help="benchmark name filters")
+    p.add_argument(
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=3,
+        help="number of repetitions per benchmark")
+    p.add_argument(
+        "--output",
+        dest="output_path",
+        type=path_arg,
+        default=None,
+        help="path to JSON results file")
+    p.add_argument(
+        "--baseline",
+        dest="baseline_path",
+        type=path_arg,
+        default=cwd / DEFAULT_BASELINE_FILE_NAME,
+        help="path to JSON baseline file")
+    p.add_argument(
+        "--tolerance",
+        dest="tolerance",
+        type=float,
+        default=0.25,
+        help="allowed fractional slowdown relative to baseline")
+    p.add_argument(
+        "--update-baseline",
+        dest="update_baseline",
+        action=BooleanOptionalAction,
+        default=False,
+        help="overwrite baseline with results")
+
+    parser.run(argv)
+
+
+if __name__ == "__main__":
+    call_main(main)
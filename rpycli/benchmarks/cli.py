@@ -0,0 +1,38 @@
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.cli import ArgumentParser, CommonArgumentsMixin
+from typing import Tuple
+
+
+class BenchArgumentParser(ArgumentParser, CommonArgumentsMixin):
+    pass
+
+
+def command() -> None:
+    pass
+
+
+def make_parser(depth: int) -> Tuple[BenchArgumentParser, list[str]]:
+    parser = BenchArgumentParser(prog="bench")
+    parser.add_log_level_argument()
+    argv: list[str] = ["--log", "debug"]
+
+    current = parser
+    for i in range(depth):
+        for j in range(4):
+            if j != 0:
+                current.add_command(f"leaf{i}-{j}", help=f"leaf {i}-{j}", func=command)
+        if i == depth - 1:
+            current = current.add_command(f"group{i}", help=f"command {i}", func=command)
+        else:
+            current = current.add_command_group(f"group{i}", help=f"group {i}")
+        current.add_dry_run_argument()
+        current.add_argument(f"--value{i}", dest=f"value{i}", type=int, default=0, help="value")
+        argv.extend([f"group{i}", "--no-dry-run", f"--value{i}", str(i)])
+
+    return parser, argv
+
+
+@benchmark("cli.parse_args_deep")
+def bench_parse_args_deep() -> Tuple[int, float]:
+    parser, argv = make_parser(depth=8)
+    return time_calls(500, lambda: parser.parse_args(argv))
@@ -0,0 +1,19 @@
+from argparse import Namespace
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.context import Context
+from rpycli.log_level import LogLevel
+from typing import Tuple
+
+
+@benchmark("context.from_args")
+def bench_from_args() -> Tuple[int, float]:
+    args = Namespace(
+        log_level=LogLevel.ERROR,
+        command=["run"],
+        func=bench_from_args,
+        input_path="input.txt",
+        count=10,
+        force=False)
+    return time_calls(
+        50_000,
+        lambda: Context.from_args(args, "bench", log_args=False))
@@ -0,0 +1,28 @@
+from colorama import Fore
+from io import StringIO
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.cprint import ColourWriter, cprint
+from time import perf_counter
+from typing import Tuple
+
+
+class TtyStringIO(StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+@benchmark("cprint.cprint")
+def bench_cprint() -> Tuple[int, float]:
+    f = TtyStringIO()
+    return time_calls(100_000, lambda: cprint(Fore.GREEN, "name", 123, file=f))
+
+
+@benchmark("cprint.colour_writer_rows")
+def bench_colour_writer_rows() -> Tuple[int, float]:
+    rows = [[f"name{i}", i, i * 2] for i in range(100_000)]
+    colours = [Fore.GREEN, Fore.YELLOW, Fore.CYAN]
+    f = TtyStringIO()
+    start_time = perf_counter()
+    with ColourWriter(file=f) as w:
+        w.print_rows(rows, colours=colours, align=True)
+    return len(rows), perf_counter() - start_time
@@ -0,0 +1,43 @@
+from pathlib import Path
+from rpycli.benchmarks.suite import benchmark
+from rpycli.fs import clean_dir, iter_files
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Tuple
+
+
+def make_tree(dir: Path, dir_count: int, file_count: int) -> None:
+    for i in range(dir_count):
+        d = dir / f"dir{i:03}" / "sub"
+        d.mkdir(parents=True)
+        for j in range(file_count):
+            suffix = ".txt" if j % 2 == 0 else ".bin"
+            (d / f"file{j:03}{suffix}").touch()
+
+
+def make_empty_tree(dir: Path, dir_count: int) -> None:
+    for i in range(dir_count):
+        (dir / f"dir{i:03}" / "a" / "b").mkdir(parents=True)
+
+
+@benchmark("fs.iter_files")
+def bench_iter_files() -> Tuple[int, float]:
+    with TemporaryDirectory() as temp_dir:
+        dir = Path(temp_dir)
+        make_tree(dir=dir, dir_count=20, file_count=100)
+        start_time = perf_counter()
+        count = sum(1 for _ in iter_files(dir, include_suffixes=[".TXT"]))
+        return count, perf_counter() - start_time
+
+
+@benchmark("fs.clean_dir")
+def bench_clean_dir() -> Tuple[int, float]:
+    dir_count = 200
+    with TemporaryDirectory() as temp_dir:
+        dir = Path(temp_dir)
+        make_empty_tree(dir=dir, dir_count=dir_count)
+        start_time = perf_counter()
+        clean_dir(dir)
+        elapsed = perf_counter() - start_time
+        assert not any(dir.iterdir())
+        return dir_count * 3, elapsed
@@ -0,0 +1,20 @@
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.invoke import invoke_func
+from typing import Any, Tuple
+
+
+def command(input_path: str, count: int, force: bool, **kwargs: Any) -> int:
+    return 0
+
+
+@benchmark("invoke.invoke_func")
+def bench_invoke_func() -> Tuple[int, float]:
+    return time_calls(
+        50_000,
+        lambda: invoke_func(
+            func=command,
+            input_path="input.txt",
+            count=10,
+            force=False,
+            dry_run=True,
+            log_level=None))
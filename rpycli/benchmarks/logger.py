@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from logging import DEBUG, ERROR
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.logger import Logger, LoggerMixin
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True)
+class NullLogger(LoggerMixin):
+    level: int
+
+    def log(self, level_name: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@benchmark("logger.log_enabled")
+def bench_log_enabled() -> Tuple[int, float]:
+    logger = Logger("bench", DEBUG)
+    return time_calls(300, lambda: logger.info("message"))
+
+
+@benchmark("logger.log_filtered")
+def bench_log_filtered() -> Tuple[int, float]:
+    logger = Logger("bench", ERROR)
+    return time_calls(300, lambda: logger.debug("message"))
+
+
+@benchmark("logger.span")
+def bench_span() -> Tuple[int, float]:
+    logger = NullLogger(level=DEBUG)
+
+    def f() -> None:
+        with logger.span("path", "to", "span"):
+            pass
+
+    return time_calls(50_000, f)
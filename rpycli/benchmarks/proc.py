@@ -0,0 +1,26 @@
+from logging import ERROR
+from rpycli.benchmarks.suite import benchmark
+from rpycli.logger import Logger
+from rpycli.proc import proc_stream
+from time import perf_counter
+from typing import Tuple
+import sys
+
+
+@benchmark("proc.proc_stream")
+def bench_proc_stream() -> Tuple[int, float]:
+    line_count = 200_000
+    logger = Logger("bench", ERROR)
+    command = [
+        sys.executable,
+        "-c",
+        f"import sys\nfor i in range({line_count}): sys.stdout.write(f'line {{i}}\\n')"
+    ]
+    start_time = perf_counter()
+    count = 0
+    with proc_stream(logger=logger, op="bench", command=command, dry_run=False) as (_, lines):
+        for _ in lines:
+            count += 1
+    elapsed = perf_counter() - start_time
+    assert count == line_count
+    return count, elapsed
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterable, Tuple
+import json
+import platform
+
+
+BenchmarkFunc = Callable[[], Tuple[int, float]]
+
+
+BENCHMARKS: dict[str, BenchmarkFunc] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFunc], BenchmarkFunc]:
+    def decorator(func: BenchmarkFunc) -> BenchmarkFunc:
+        assert name not in BENCHMARKS
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def time_calls(count: int, func: Callable[[], Any]) -> Tuple[int, float]:
+    start_time = perf_counter()
+    for _ in range(count):
+        func()
+    return count, perf_counter() - start_time
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    ops: int
+    seconds: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds if self.seconds > 0.0 else float("inf")
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def ratio(self) -> float:
+        return self.ops_per_sec / self.baseline_ops_per_sec
+
+
+def run_benchmarks(names: Iterable[str], repeat: int = 3) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for name in names:
+        func = BENCHMARKS[name]
+        best: BenchmarkResult | None = None
+        for _ in range(repeat):
+            ops, seconds = func()
+            result = BenchmarkResult(name=name, ops=ops, seconds=seconds)
+            if best is None or result.ops_per_sec > best.ops_per_sec:
+                best = result
+        assert best is not None
+        results.append(best)
+    return results
+
+
+def find_regressions(results: Iterable[BenchmarkResult], baseline: dict[str, float], tolerance: float) -> list[Regression]:
+    regressions: list[Regression] = []
+    for result in results:
+        baseline_ops_per_sec = baseline.get(result.name)
+        if baseline_ops_per_sec is None:
+            continue
+        if result.ops_per_sec < baseline_ops_per_sec * (1.0 - tolerance):
+            regressions.append(Regression(
+                name=result.name,
+                baseline_ops_per_sec=baseline_ops_per_sec,
+                ops_per_sec=result.ops_per_sec))
+    return regressions
+
+
+def write_results(path: Path, results: Iterable[BenchmarkResult]) -> None:
+    obj = {
+        "python": platform.python_version(),
+        "results": {
+            r.name: {
+                "ops": r.ops,
+                "seconds": r.seconds,
+                "ops_per_sec": r.ops_per_sec
+            }
+            for r in results
+        }
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wt") as f:
+        json.dump(obj, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_baseline(path: Path) -> dict[str, float]:
+    with path.open("rt") as f:
+        obj = json.load(f)
+    return {k: float(v["ops_per_sec"]) for k, v in obj["results"].items()}
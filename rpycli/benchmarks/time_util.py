@@ -0,0 +1,33 @@
+from rpycli.benchmarks.suite import benchmark, time_calls
+from rpycli.time_util import format_duration, parse_duration, parse_durations
+from time import perf_counter
+from typing import Tuple
+
+
+def make_duration_strs(count: int) -> list[str]:
+    return [
+        f"{i % 24}:{i % 60:02}:{i % 60:02}.{i % 100:02}" if i % 50 != 0 else "N/A"
+        for i in range(count)
+    ]
+
+
+@benchmark("time_util.parse_duration")
+def bench_parse_duration() -> Tuple[int, float]:
+    ss = make_duration_strs(100_000)
+    start_time = perf_counter()
+    for s in ss:
+        parse_duration(s)
+    return len(ss), perf_counter() - start_time
+
+
+@benchmark("time_util.parse_durations")
+def bench_parse_durations() -> Tuple[int, float]:
+    ss = make_duration_strs(100_000)
+    start_time = perf_counter()
+    parse_durations(ss)
+    return len(ss), perf_counter() - start_time
+
+
+@benchmark("time_util.format_duration")
+def bench_format_duration() -> Tuple[int, float]:
+    return time_calls(100_000, lambda: format_duration(3723.5))
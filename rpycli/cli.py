@@ -3,18 +3,25 @@ from argparse import \
     ArgumentTypeError, \
     BooleanOptionalAction, \
     Namespace
+from colorama import Fore
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import \
     MISSING, \
+    dataclass, \
     _MISSING_TYPE  # type: ignore[reportPrivateUsage]
 from enum import StrEnum, Enum
-from functools import cached_property
+from functools import cache, cached_property
 from pathlib import Path
 from rpycli.arg_enum import ArgEnum
+from rpycli.cprint import cprint
+from rpycli.error import ReportableError
 from rpycli.log_level import LogLevel
-from typing import Any, Optional, Protocol, Self, Sequence, Tuple, TypeVar, cast, overload
+from typing import Any, Iterable, Optional, Protocol, Self, Sequence, TextIO, Tuple, TypeVar, cast, overload
 import argparse
 import rpycli.invoke
+import shlex
 import sys
+import traceback
 
 
 class ArgumentParserProtocol(Protocol):
@@ -40,6 +47,17 @@ class CommandCallable(Protocol[_T0]):
 _N = TypeVar("_N")
 
 
+@dataclass(frozen=True)
+class BatchResult:
+    line_number: int
+    argv: list[str]
+    exit_code: int
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
 class ArgumentParser(argparse.ArgumentParser):
     @staticmethod
     def invoke_func(args: Namespace, **kwargs: Any) -> None:
@@ -101,18 +119,20 @@ class ArgumentParser(argparse.ArgumentParser):
             from_str = type
             to_str = str
         elif issubclass(type, Enum):
+            lookup = _enum_str_lookup(type)
+
             def temp(s: str) -> Any:
-                for member in type:
-                    if str(member) == s:
-                        return member
-                raise ValueError(f"invalid value '{s}'")
+                try:
+                    return lookup[s]
+                except KeyError:
+                    raise ValueError(f"invalid value '{s}'") from None
             from_str = temp
             to_str = str
         else:
             raise NotImplementedError()
 
         assert to_str is not None
-        choices_str = ", ".join(to_str(m) for m in type)
+        choices_str = _choices_str(type, to_str)
 
         def from_str_wrapped(s: str) -> Any:
             try:
@@ -166,6 +186,82 @@ class ArgumentParser(argparse.ArgumentParser):
         args = self.parse_args(argv)
         self.__class__.invoke_func(args, **kwargs)
 
+    def run_batch_file(self, batch: Path | TextIO, /, *, batch_prefix_argv: Sequence[str] = (), batch_workers: int = 1, **kwargs: Any) -> None:
+        if isinstance(batch, Path):
+            with batch.open("rt") as f:
+                lines = f.readlines()
+        else:
+            lines = batch.readlines()
+
+        results = self.run_batch(
+            lines,
+            batch_prefix_argv=batch_prefix_argv,
+            batch_workers=batch_workers,
+            **kwargs)
+
+        for result in results:
+            cprint(
+                Fore.LIGHTGREEN_EX if result.ok else Fore.LIGHTRED_EX,
+                f"line {result.line_number}: exit code {result.exit_code}: {shlex.join(result.argv)}",
+                file=sys.stderr)
+
+        succeeded = sum(1 for r in results if r.ok)
+        cprint(
+            Fore.LIGHTGREEN_EX if succeeded == len(results) else Fore.LIGHTRED_EX,
+            f"{succeeded} of {len(results)} lines succeeded",
+            file=sys.stderr)
+        if succeeded != len(results):
+            sys.exit(1)
+
+    def run_batch(self, lines: Iterable[str], /, *, batch_prefix_argv: Sequence[str] = (), batch_workers: int = 1, **kwargs: Any) -> list[BatchResult]:
+        items: list[Tuple[int, list[str], str | None]] = []
+        for i, line in enumerate(lines):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as e:
+                items.append((i + 1, [line.strip()], str(e)))
+                continue
+            if len(argv) > 0:
+                items.append((i + 1, [*batch_prefix_argv, *argv], None))
+
+        def run_line(item: Tuple[int, list[str], str | None]) -> BatchResult:
+            line_number, argv, error = item
+            if error is not None:
+                cprint(
+                    Fore.LIGHTRED_EX,
+                    f"line {line_number}: {error}",
+                    file=sys.stderr)
+                return BatchResult(
+                    line_number=line_number,
+                    argv=argv,
+                    exit_code=2)
+
+            try:
+                args = self.parse_args(argv)
+                self.__class__.invoke_func(args, **kwargs)
+                exit_code = 0
+            except SystemExit as e:
+                match e.code:
+                    case None: exit_code = 0
+                    case int() as code: exit_code = code
+                    case _: exit_code = 1
+            except ReportableError as e:
+                cprint(Fore.LIGHTRED_EX, str(e), file=sys.stderr)
+                exit_code = e.exit_code
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+            return BatchResult(
+                line_number=line_number,
+                argv=argv,
+                exit_code=exit_code)
+
+        if batch_workers <= 1:
+            return [run_line(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=batch_workers) as executor:
+            return list(executor.map(run_line, items))
+
     @cached_property
     def _commands(self) -> Any:
         parent = getattr(self, "_RPYCLI_parent", None)
@@ -185,6 +281,19 @@ class ArgumentParser(argparse.ArgumentParser):
         return subparsers
 
 
+@cache
+def _enum_str_lookup(type: Any) -> dict[str, Any]:
+    lookup: dict[str, Any] = {}
+    for member in type:
+        lookup.setdefault(str(member), member)
+    return lookup
+
+
+@cache
+def _choices_str(type: Any, to_str: Any) -> str:
+    return ", ".join(to_str(m) for m in type)
+
+
 class CommonArgumentsMixin:
     def add_log_level_argument(self: ArgumentParserProtocol) -> Action:
         return self.add_enum_argument(
@@ -40,6 +40,8 @@ class ContextProtocol(Protocol):
 
 
 class ContextMixin:
+    __slots__ = ()
+
     @property
     def log_level(self: ContextBaseProtocol) -> int:
         return self.logger.level
@@ -68,12 +70,32 @@ class ContextMixin:
 _T3 = TypeVar("_T3", bound="Context")
 
 
-@dataclass(frozen=True)
+_ContextClassKey = tuple[type["Context"], tuple[tuple[str, type[object]], ...]]
+
+
+_CONTEXT_CLASSES: dict[_ContextClassKey, type["Context"]] = {}
+
+
+def _make_context_class(base: type["Context"], fields: tuple[tuple[str, type[object]], ...]) -> type["Context"]:
+    key = (base, fields)
+    ctx_cls = _CONTEXT_CLASSES.get(key)
+    if ctx_cls is None:
+        ctx_cls = make_dataclass(
+            cls_name=f"{base.__name__}_WRAPPED",
+            fields=[(k, cast(object, t)) for k, t in fields],
+            bases=(base,),
+            frozen=True,
+            slots=True)
+        _CONTEXT_CLASSES[key] = ctx_cls
+    return ctx_cls
+
+
+@dataclass(frozen=True, slots=True)
 class Context(ContextMixin):
     logger: LoggerProtocol
 
     @classmethod
-    def from_args(cls: type[_T3], args: Namespace, name: Optional[str] = None, **kwargs: Any) -> _T3:
+    def from_args(cls: type[_T3], args: Namespace, name: Optional[str] = None, log_args: bool = True, **kwargs: Any) -> _T3:
         def encode_arg_value(obj: Any) -> str:
             if isinstance(obj, list):
                 items: list[Any] = obj
@@ -92,16 +114,15 @@ class Context(ContextMixin):
             except KeyError:
                 pass
 
-        ctx_cls = make_dataclass(
-            cls_name=f"{cls.__name__}_WRAPPED",
-            fields=[(k, cast(object, type(v))) for k, v in d.items()],
-            bases=(cls,),
-            frozen=True)
+        fields: tuple[tuple[str, type[object]], ...] = tuple(
+            (k, cast(type[object], type(v))) for k, v in d.items())
+        ctx_cls = _make_context_class(cast(type[Context], cls), fields)
 
         logger = Logger(name=name, level=log_level)
         ctx = ctx_cls(logger=logger, **d)
-        for k in sorted(args.__dict__.keys() - SKIP_ARGS):
-            s = encode_arg_value(args.__dict__[k])
-            ctx.log_info(f"{k} = {s}")
+        if log_args:
+            for k in sorted(args.__dict__.keys() - SKIP_ARGS):
+                s = encode_arg_value(args.__dict__[k])
+                ctx.log_info(f"{k} = {s}")
 
         return cast(_T3, ctx)
@@ -1,11 +1,108 @@
 from colorama import Style
-from io import StringIO
-from typing import Any
+from types import TracebackType
+from typing import Any, Iterable, Self, Sequence, TextIO
 import sys
 
 
-def cprint(fore: str, *args: Any, **kwargs: Any) -> None:
-    file = kwargs.pop("file", sys.stdout)
-    with StringIO() as stream:
-        print(*args, **kwargs, file=stream)
-        print(fore + stream.getvalue() + Style.RESET_ALL, end="", file=file)
+DEFAULT_BUFFER_SIZE: int = 64 * 1024
+
+
+def cprint(fore: str, *args: Any, sep: str | None = " ", end: str | None = "\n", file: TextIO | None = None, flush: bool = False) -> None:
+    file = sys.stdout if file is None else file
+    if file is None:
+        return
+    sep = " " if sep is None else sep
+    end = "\n" if end is None else end
+    s = sep.join(map(str, args)) + end
+    if is_colour_stream(file):
+        s = fore + s + Style.RESET_ALL
+    file.write(s)
+    if flush:
+        file.flush()
+
+
+def is_colour_stream(file: Any) -> bool:
+    isatty = getattr(file, "isatty", None)
+    if isatty is None:
+        return False
+    try:
+        return bool(isatty())
+    except ValueError:
+        return False
+
+
+class ColourWriter:
+    def __init__(self, file: TextIO | None = None, colour: bool | None = None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self._file: TextIO | None = sys.stdout if file is None else file
+        self._colour = is_colour_stream(self._file) if colour is None else colour
+        self._buffer_size = buffer_size
+        self._parts: list[str] = []
+        self._size = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.flush()
+
+    @property
+    def colour(self) -> bool:
+        return self._colour
+
+    def print(self, fore: str, *args: Any, sep: str = " ", end: str = "\n") -> None:
+        s = sep.join(map(str, args)) + end
+        self._append(fore + s + Style.RESET_ALL if self._colour else s)
+
+    def print_row(self, cells: Iterable[Any], colours: Sequence[str], sep: str = " ", end: str = "\n") -> None:
+        self._append(self._format_row(
+            [str(cell) for cell in cells],
+            colours=colours,
+            widths=None,
+            sep=sep,
+            end=end))
+
+    def print_rows(self, rows: Iterable[Iterable[Any]], colours: Sequence[str], sep: str = " ", end: str = "\n", align: bool = False) -> None:
+        str_rows = [[str(cell) for cell in row] for row in rows]
+        widths: list[int] | None = None
+        if align:
+            widths = []
+            for row in str_rows:
+                for i, cell in enumerate(row):
+                    if i < len(widths):
+                        widths[i] = max(widths[i], len(cell))
+                    else:
+                        widths.append(len(cell))
+
+        self._append("".join(
+            self._format_row(row, colours=colours, widths=widths, sep=sep, end=end)
+            for row in str_rows))
+
+    def flush(self) -> None:
+        self._write()
+        if self._file is not None:
+            self._file.flush()
+
+    def _format_row(self, cells: list[str], colours: Sequence[str], widths: list[int] | None, sep: str, end: str) -> str:
+        last = len(cells) - 1
+        parts: list[str] = []
+        for i, cell in enumerate(cells):
+            if widths is not None and i != last:
+                cell = cell.ljust(widths[i])
+            if self._colour and i < len(colours):
+                parts.append(colours[i] + cell + Style.RESET_ALL)
+            else:
+                parts.append(cell)
+        return sep.join(parts) + end
+
+    def _append(self, s: str) -> None:
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self._buffer_size:
+            self._write()
+
+    def _write(self) -> None:
+        if len(self._parts) > 0:
+            if self._file is not None:
+                self._file.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
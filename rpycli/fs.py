@@ -1,4 +1,5 @@
 from pathlib import Path
+from rpycli.progress import Progress
 from shutil import which
 from typing import Iterable
 import os
@@ -41,7 +42,7 @@ def clean_dir(dir: Path, fail_ok: bool = False) -> None:
                     p.rmdir()
 
 
-def iter_files(start_dir: Path, include_suffixes: Iterable[str] | None = None, ignore_dirs: Iterable[str] | None = None) -> Iterable[Path]:
+def iter_files(start_dir: Path, include_suffixes: Iterable[str] | None = None, ignore_dirs: Iterable[str] | None = None, progress: Progress | None = None) -> Iterable[Path]:
     include_suffixes = {x.lower() for x in include_suffixes} \
         if include_suffixes is not None \
         else None
@@ -58,4 +59,6 @@ def iter_files(start_dir: Path, include_suffixes: Iterable[str] | None = None, i
         for f in fs:
             p = d / f
             if include_suffixes is None or p.suffix.lower() in include_suffixes:
+                if progress is not None:
+                    progress.count += 1
                 yield p
@@ -1,13 +1,14 @@
 from contextlib import contextmanager
 from rpycli.error import ReportableError
-from rpycli.logging import LoggerProtocol
+from rpycli.logger import LoggerProtocol
+from rpycli.progress import Progress
 from subprocess import PIPE, Popen, STDOUT
 from typing import Any, Iterator, Never, Tuple
 import shlex
 
 
 @contextmanager
-def proc_stream(logger: LoggerProtocol, op: str, command: list[Any], dry_run: bool = True, text: bool = True, encoding: str = "utf-8", errors: str = "replace") -> Iterator[Tuple[Popen[bytes] | None, list[Never] | Iterator[bytes] | Iterator[str]]]:
+def proc_stream(logger: LoggerProtocol, op: str, command: list[Any], dry_run: bool = True, text: bool = True, encoding: str = "utf-8", errors: str = "replace", progress: Progress | None = None) -> Iterator[Tuple[Popen[bytes] | None, list[Never] | Iterator[bytes] | Iterator[str]]]:
     c = [str(x) for x in command]
     command_str = shlex.join(c)
 
@@ -20,6 +21,8 @@ def proc_stream(logger: LoggerProtocol, op: str, command: list[Any], dry_run: bo
             with Popen(c, stdout=PIPE, stderr=STDOUT, text=False) as proc:
                 assert proc.stdout is not None
                 stdout = iter(proc.stdout.readline, b"")
+                if progress is not None:
+                    stdout = _track(stdout, progress)
                 if text:
                     yield proc, map(
                         lambda b: b.decode(encoding=encoding, errors=errors),
@@ -31,3 +34,10 @@ def proc_stream(logger: LoggerProtocol, op: str, command: list[Any], dry_run: bo
             if proc.returncode != 0:
                 raise ReportableError(
                     f"{op} failed with exit code {proc.returncode}: pass \"--log debug\" to get more details")
+
+
+def _track(lines: Iterator[bytes], progress: Progress) -> Iterator[bytes]:
+    for line in lines:
+        progress.count += 1
+        progress.bytes += len(line)
+        yield line
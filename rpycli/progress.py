@@ -0,0 +1,115 @@
+from rpycli.cprint import is_colour_stream
+from rpycli.time_util import format_duration
+from threading import Event, Thread
+from time import perf_counter
+from types import TracebackType
+from typing import Self, TextIO
+import sys
+
+
+DEFAULT_REFRESH_INTERVAL: float = 0.2
+DEFAULT_SUMMARY_INTERVAL: float = 10.0
+
+
+def format_bytes(n: float) -> str:
+    if abs(n) < 1024.0:
+        return f"{n:.0f} B"
+    for unit in ["KiB", "MiB", "GiB"]:
+        n /= 1024.0
+        if abs(n) < 1024.0:
+            return f"{n:.1f} {unit}"
+    return f"{n / 1024.0:.1f} TiB"
+
+
+class Progress:
+    def __init__(self, label: str, total: int | None = None, total_bytes: int | None = None, file: TextIO | None = None, tty: bool | None = None, refresh_interval: float = DEFAULT_REFRESH_INTERVAL, summary_interval: float = DEFAULT_SUMMARY_INTERVAL) -> None:
+        self.count = 0
+        self.bytes = 0
+        self.total = total
+        self.total_bytes = total_bytes
+        self._label = label
+        self._file = sys.stderr if file is None else file
+        self._tty = is_colour_stream(self._file) if tty is None else tty
+        self._interval = refresh_interval if self._tty else summary_interval
+        self._start_time = perf_counter()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._last_width = 0
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        assert self._thread is None
+        self._start_time = perf_counter()
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name=f"progress-{self._label}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.render(final=True)
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self._start_time
+
+    def status(self) -> str:
+        elapsed = self.elapsed
+        count = self.count
+        nbytes = self.bytes
+
+        parts: list[str] = []
+        if self.total is None:
+            parts.append(f"{count:,}")
+        else:
+            parts.append(f"{count:,}/{self.total:,}")
+
+        if nbytes > 0 or self.total_bytes is not None:
+            if self.total_bytes is None:
+                parts.append(format_bytes(nbytes))
+            else:
+                parts.append(f"{format_bytes(nbytes)}/{format_bytes(self.total_bytes)}")
+
+        if elapsed > 0.0:
+            rate = f"{count / elapsed:,.1f}/s"
+            if nbytes > 0:
+                rate += f", {format_bytes(nbytes / elapsed)}/s"
+            parts.append(rate)
+
+        eta = self.eta()
+        if eta is not None:
+            parts.append(f"ETA {format_duration(round(eta))}")
+        parts.append(f"elapsed {format_duration(round(elapsed))}")
+
+        return f"{self._label}: " + ", ".join(parts)
+
+    def eta(self) -> float | None:
+        elapsed = self.elapsed
+        if self.total_bytes is not None and self.bytes > 0:
+            return max(self.total_bytes - self.bytes, 0) * elapsed / self.bytes
+        if self.total is not None and self.count > 0:
+            return max(self.total - self.count, 0) * elapsed / self.count
+        return None
+
+    def render(self, final: bool = False) -> None:
+        s = self.status()
+        if self._tty:
+            padding = " " * max(self._last_width - len(s), 0)
+            self._last_width = len(s)
+            self._file.write("\r" + s + padding + ("\n" if final else ""))
+        else:
+            self._file.write(s + "\n")
+        self._file.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.render(final=False)
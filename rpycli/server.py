@@ -0,0 +1,389 @@
+from pathlib import Path
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+
+if TYPE_CHECKING:
+    from rpycli.init import MainCallable
+
+
+_HEADER: struct.Struct = struct.Struct("!I")
+_EXIT_CODE: struct.Struct = struct.Struct("!i")
+_PID: struct.Struct = struct.Struct("!i")
+_FORWARDED_SIGNALS: list[signal.Signals] = [signal.SIGINT, signal.SIGTERM]
+_STDIO_FD_COUNT: int = 3
+_MAX_PAYLOAD_SIZE: int = 16 * 1024 * 1024
+
+
+_LISTENER_FD_ENV: str = "RPYCLI_SERVER_LISTENER_FD"
+
+
+DEFAULT_CONNECT_TIMEOUT: float = 2.0
+DEFAULT_HANDSHAKE_TIMEOUT: float = 5.0
+
+
+def default_socket_path(name: str) -> Path:
+    _check_platform()
+
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    dir = Path(runtime_dir) / "rpycli" \
+        if runtime_dir is not None and len(runtime_dir) > 0 \
+        else Path.home() / ".rpycli" / "run"
+    dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    st = dir.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o077 != 0:
+        raise RuntimeError(f"Directory {dir} must be owned by the current user with mode 0700")
+
+    return dir / f"{name}.sock"
+
+
+def forward(socket_path: Path, argv: Sequence[str] | None = None, stdio: Sequence[int] = (0, 1, 2), connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> int:
+    _check_platform()
+
+    payload = json.dumps({
+        "cwd": os.getcwd(),
+        "argv": list(sys.argv if argv is None else argv),
+        "env": dict(os.environ),
+    }).encode("utf-8")
+
+    with _SignalForwarder() as forwarder, _connect(socket_path, timeout=connect_timeout) as sock:
+        peer_uid = _peer_uid(sock)
+        if peer_uid != os.getuid():
+            raise PermissionError(f"Server on {socket_path} is running as user {peer_uid}")
+        if forwarder.signum is not None:
+            return 128 + forwarder.signum
+
+        socket.send_fds(sock, [_HEADER.pack(len(payload))], list(stdio))
+        sock.sendall(payload)
+
+        data = _recv_exactly(sock, _PID.size)
+        if data is not None:
+            forwarder.set_pid(_PID.unpack(data)[0])
+            data = _recv_exactly(sock, _EXIT_CODE.size)
+
+        if forwarder.signum is not None:
+            return 128 + forwarder.signum
+        if data is None:
+            raise ConnectionError("Server closed connection without exit code")
+        exit_code: int = _EXIT_CODE.unpack(data)[0]
+        return exit_code
+
+
+def serve(func: "MainCallable[Any]", socket_path: Path, watch_paths: Iterable[Path] | None = None, init: bool = True, poll_interval: float = 1.0, handshake_timeout: float = DEFAULT_HANDSHAKE_TIMEOUT) -> None:
+    _check_platform()
+
+    from logging import INFO
+    from rpycli.logger import Logger
+
+    logger = Logger("rpycli.server", INFO)
+    watch_paths = _module_paths() \
+        if watch_paths is None \
+        else list(watch_paths)
+    mtimes = _snapshot(watch_paths)
+
+    sock = _adopt_listener(socket_path)
+    if sock is None:
+        sock = _bind(socket_path)
+
+    restart = False
+    try:
+        sock.settimeout(poll_interval)
+        while True:
+            _reap_children()
+
+            if _snapshot(watch_paths) != mtimes:
+                restart = True
+                break
+
+            try:
+                conn, _ = sock.accept()
+            except TimeoutError:
+                continue
+            except OSError as e:
+                logger.error(f"accept failed: {e}")
+                time.sleep(poll_interval)
+                continue
+
+            with conn:
+                try:
+                    if _peer_uid(conn) != os.getuid():
+                        continue
+                    conn.settimeout(handshake_timeout)
+                    _handle(func=func, listener=sock, conn=conn, init=init)
+                except (TimeoutError, ConnectionError):
+                    pass
+                except OSError as e:
+                    logger.error(f"request failed: {e}")
+    finally:
+        if not restart:
+            sock.close()
+            socket_path.unlink(missing_ok=True)
+
+    sock.set_inheritable(True)
+    os.environ[_LISTENER_FD_ENV] = str(sock.fileno())
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, sys.orig_argv)
+
+
+def _handle(func: "MainCallable[Any]", listener: socket.socket, conn: socket.socket, init: bool) -> None:
+    header, fds, _, _ = socket.recv_fds(
+        conn,
+        _HEADER.size,
+        _STDIO_FD_COUNT)
+    try:
+        if len(header) != _HEADER.size or len(fds) != _STDIO_FD_COUNT:
+            return
+        size = _HEADER.unpack(header)[0]
+        if size > _MAX_PAYLOAD_SIZE:
+            return
+        data = _recv_exactly(conn, size)
+        if data is None:
+            return
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            listener.close()
+            conn.settimeout(None)
+            exit_code = 1
+            done = threading.Event()
+            try:
+                os.setpgid(0, 0)
+                conn.sendall(_PID.pack(os.getpid()))
+                _watch_client(conn, done)
+                exit_code = _run_child(
+                    func=func,
+                    request=json.loads(data),
+                    fds=fds,
+                    init=init)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                done.set()
+                try:
+                    conn.sendall(_EXIT_CODE.pack(exit_code))
+                finally:
+                    os._exit(exit_code)
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _run_child(func: "MainCallable[Any]", request: dict[str, Any], fds: list[int], init: bool) -> int:
+    from rpycli.init import call_main
+
+    for i, fd in enumerate(fds):
+        os.dup2(fd, i)
+    for fd in fds:
+        if fd > 2:
+            os.close(fd)
+
+    sys.stdin = open(0, "rt", closefd=False)
+    sys.stdout = open(1, "wt", closefd=False)
+    sys.stderr = open(2, "wt", closefd=False)
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.argv = request["argv"]
+
+    result: Any
+    try:
+        result = call_main(func, init=init)
+    except SystemExit as e:
+        result = e.code
+    except BaseException as e:
+        try:
+            sys.excepthook(type(e), e, e.__traceback__)
+            result = 1
+        except SystemExit as e:
+            result = e.code
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    match result:
+        case None: return 0
+        case bool() as b: return 0 if b else 1
+        case int() as exit_code: return exit_code
+        case _:
+            print(result, file=sys.stderr)
+            sys.stderr.flush()
+            return 1
+
+
+class _SignalForwarder:
+    def __init__(self) -> None:
+        self.signum: int | None = None
+        self._pid: int | None = None
+        self._previous: dict[signal.Signals, Any] = {}
+
+    def __enter__(self) -> "_SignalForwarder":
+        if threading.current_thread() is threading.main_thread():
+            for signum in _FORWARDED_SIGNALS:
+                self._previous[signum] = signal.signal(signum, self._handle)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+        self._previous.clear()
+
+    def set_pid(self, pid: int) -> None:
+        self._pid = pid
+        if self.signum is not None:
+            _kill_group(pid, self.signum)
+
+    def _handle(self, signum: int, frame: Any) -> None:
+        if self.signum is None:
+            self.signum = signum
+        if self._pid is not None:
+            _kill_group(self._pid, signum)
+
+
+def _kill_group(pid: int, signum: int) -> None:
+    try:
+        os.killpg(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def _watch_client(conn: socket.socket, done: threading.Event) -> None:
+    def watch() -> None:
+        try:
+            while len(conn.recv(4096)) > 0:
+                pass
+        except OSError:
+            pass
+        if not done.is_set():
+            _kill_group(os.getpid(), signal.SIGTERM)
+
+    threading.Thread(target=watch, name="rpycli-client-watch", daemon=True).start()
+
+
+def _connect(socket_path: Path, timeout: float) -> socket.socket:
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(socket_path))
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(delay)
+            delay = min(delay * 2.0, 0.2)
+        except:
+            sock.close()
+            raise
+
+
+def _adopt_listener(socket_path: Path) -> socket.socket | None:
+    value = os.environ.pop(_LISTENER_FD_ENV, None)
+    if value is None:
+        return None
+
+    sock = socket.socket(fileno=int(value))
+    sock.set_inheritable(False)
+    if sock.family != socket.AF_UNIX or not socket_path.exists():
+        sock.close()
+        return None
+
+    return sock
+
+
+def _bind(socket_path: Path) -> socket.socket:
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except ConnectionRefusedError:
+                socket_path.unlink()
+            else:
+                raise RuntimeError(f"Server already listening on {socket_path}")
+
+    temp_path = socket_path.with_name(f".{socket_path.name}.{os.getpid()}")
+    temp_path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(str(temp_path))
+        os.chmod(temp_path, 0o600)
+        sock.listen()
+        os.replace(temp_path, socket_path)
+    except:
+        sock.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+    return sock
+
+
+def _peer_uid(sock: socket.socket) -> int:
+    if sys.platform == "linux":
+        data = sock.getsockopt(
+            socket.SOL_SOCKET,
+            socket.SO_PEERCRED,
+            struct.calcsize("3i"))
+        uid: int = struct.unpack("3i", data)[1]
+        return uid
+    if sys.platform == "darwin":
+        # struct xucred: u_int cr_version, uid_t cr_uid, short cr_ngroups, gid_t cr_groups[16]
+        data = sock.getsockopt(0, socket.LOCAL_PEERCRED, 76)
+        cr_uid: int = struct.unpack_from("2I", data)[1]
+        return cr_uid
+    raise NotImplementedError(f"Unsupported platform \"{sys.platform}\"")
+
+
+def _recv_exactly(sock: socket.socket, n: int) -> bytes | None:
+    buffer = bytearray()
+    while len(buffer) < n:
+        chunk = sock.recv(n - len(buffer))
+        if len(chunk) == 0:
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def _reap_children() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _module_paths() -> list[Path]:
+    paths: set[Path] = set()
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if file is not None:
+            paths.add(Path(file))
+    return sorted(paths)
+
+
+def _snapshot(paths: Iterable[Path]) -> dict[Path, int | None]:
+    def mtime(p: Path) -> int | None:
+        try:
+            return p.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    return {p: mtime(p) for p in paths}
+
+
+def _check_platform() -> None:
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        raise NotImplementedError(f"Unsupported platform \"{sys.platform}\"")
@@ -0,0 +1,85 @@
+from enum import Enum
+from rpycli.arg_enum import ArgEnum
+from rpycli.cli import ArgumentParser
+import pytest
+
+
+class Colour(ArgEnum):
+    RED = 1
+    GREEN = 2
+    VERT = 2
+
+
+class Shape(Enum):
+    CIRCLE = "circle"
+    SQUARE = "square"
+
+
+def test_from_arg() -> None:
+    assert Colour.from_arg("red") is Colour.RED
+    assert Colour.from_arg("green") is Colour.GREEN
+
+    with pytest.raises(ValueError):
+        Colour.from_arg("RED")
+
+    with pytest.raises(ValueError):
+        Colour.from_arg("vert")
+
+
+def test_from_arg_ignore_case() -> None:
+    assert Colour.from_arg("RED", ignore_case=True) is Colour.RED
+    assert Colour.from_arg("Green", ignore_case=True) is Colour.GREEN
+
+
+def test_from_arg_aliases() -> None:
+    assert Colour.from_arg("vert", aliases=True) is Colour.GREEN
+    assert Colour.from_arg("VERT", ignore_case=True, aliases=True) is Colour.GREEN
+
+
+def test_from_args() -> None:
+    assert Colour.from_args(["red", "green", "red"]) == [
+        Colour.RED,
+        Colour.GREEN,
+        Colour.RED
+    ]
+    assert Colour.from_args(iter([])) == []
+
+    with pytest.raises(ValueError):
+        Colour.from_args(["red", "blue"])
+
+
+def test_add_enum_argument() -> None:
+    parser = ArgumentParser()
+    parser.add_enum_argument(
+        "--colour",
+        dest="colour",
+        type=Colour,
+        default=Colour.RED,
+        help="colour")
+    parser.add_enum_argument(
+        "--shape",
+        dest="shape",
+        type=Shape,
+        default=Shape.CIRCLE,
+        help="shape")
+
+    args = parser.parse_args(["--colour", "green", "--shape", "Shape.SQUARE"])
+    assert args.colour is Colour.GREEN
+    assert args.shape is Shape.SQUARE
+
+    args = parser.parse_args([])
+    assert args.colour is Colour.RED
+    assert args.shape is Shape.CIRCLE
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--colour", "blue"])
+
+
+def test_from_arg_collision() -> None:
+    class Collision(ArgEnum):
+        Foo = 1
+        FOO = 2
+
+    assert Collision.from_arg("foo") is Collision.Foo
+    assert Collision.from_arg("FOO", ignore_case=True) is Collision.Foo
+    assert Collision.from_args(["foo"]) == [Collision.Foo]
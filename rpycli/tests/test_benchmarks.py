@@ -0,0 +1,25 @@
+from pathlib import Path
+from rpycli.benchmarks.suite import \
+    BenchmarkResult, \
+    find_regressions, \
+    read_baseline, \
+    write_results
+
+
+def test_find_regressions(tmp_path: Path) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    write_results(baseline_path, [
+        BenchmarkResult(name="a", ops=100, seconds=1.0),
+        BenchmarkResult(name="b", ops=100, seconds=1.0),
+    ])
+    baseline = read_baseline(baseline_path)
+    assert baseline == {"a": 100.0, "b": 100.0}
+
+    results = [
+        BenchmarkResult(name="a", ops=80, seconds=1.0),
+        BenchmarkResult(name="b", ops=50, seconds=1.0),
+        BenchmarkResult(name="c", ops=1, seconds=1.0),
+    ]
+    regressions = find_regressions(results, baseline=baseline, tolerance=0.25)
+    assert [r.name for r in regressions] == ["b"]
+    assert regressions[0].ratio == 0.5
@@ -0,0 +1,102 @@
+from io import StringIO
+from pathlib import Path
+from rpycli.cli import ArgumentParser
+from rpycli.error import ReportableError
+from threading import Lock
+import pytest
+
+
+def make_parser(calls: list[str]) -> ArgumentParser:
+    lock = Lock()
+
+    def echo(value: str) -> None:
+        with lock:
+            calls.append(value)
+
+    def fail(exit_code: int) -> int:
+        return exit_code
+
+    def error(message: str) -> None:
+        raise ReportableError(message, exit_code=3)
+
+    parser = ArgumentParser(prog="test")
+    p = parser.add_command("echo", help="echo", func=echo)
+    p.add_argument("value")
+    p = parser.add_command("fail", help="fail", func=fail)
+    p.add_argument("exit_code", type=int)
+    p = parser.add_command("error", help="error", func=error)
+    p.add_argument("message")
+    return parser
+
+
+def test_run_batch() -> None:
+    calls: list[str] = []
+    parser = make_parser(calls)
+    results = parser.run_batch([
+        "echo a\n",
+        "\n",
+        "# comment\n",
+        "echo 'b c'\n",
+        "fail 5\n",
+        "error oops\n",
+        "bogus\n",
+        "echo 'unterminated\n",
+        "echo d\n",
+    ])
+
+    assert calls == ["a", "b c", "d"]
+    assert [(r.line_number, r.exit_code) for r in results] == [
+        (1, 0),
+        (4, 0),
+        (5, 5),
+        (6, 3),
+        (7, 2),
+        (8, 2),
+        (9, 0),
+    ]
+    assert results[1].argv == ["echo", "b c"]
+
+
+def test_run_batch_workers() -> None:
+    calls: list[str] = []
+    parser = make_parser(calls)
+    results = parser.run_batch(
+        [f"echo {i}" for i in range(100)],
+        batch_workers=4)
+    assert sorted(calls, key=int) == [str(i) for i in range(100)]
+    assert all(r.ok for r in results)
+    assert [r.line_number for r in results] == list(range(1, 101))
+
+
+def test_run_batch_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    calls: list[str] = []
+    parser = make_parser(calls)
+    batch_path = tmp_path / "batch.txt"
+    batch_path.write_text("echo a\necho b\n")
+    parser.run_batch_file(batch_path)
+    assert calls == ["a", "b"]
+    err = capsys.readouterr().err
+    assert "line 1: exit code 0: echo a" in err
+    assert "2 of 2 lines succeeded" in err
+
+    with pytest.raises(SystemExit) as e:
+        parser.run_batch_file(StringIO("echo c\nfail 1\necho d\n"))
+    assert e.value.code == 1
+    assert calls == ["a", "b", "c", "d"]
+    err = capsys.readouterr().err
+    assert "line 2: exit code 1: fail 1" in err
+    assert "2 of 3 lines succeeded" in err
+
+
+def test_run_passes_kwargs() -> None:
+    received: list[tuple[str, int]] = []
+
+    def command(value: str, workers: int, batch: int) -> None:
+        received.append((value, workers + batch))
+
+    parser = ArgumentParser(prog="test")
+    p = parser.add_command("command", help="command", func=command)
+    p.add_argument("value")
+    parser.run(["command", "a"], workers=8, batch=1)
+    parser.run_batch(["command b"], workers=2, batch=3)
+    assert received == [("a", 9), ("b", 5)]
@@ -31,3 +31,18 @@ def test_context_from_args() -> None:
     args.log_level = LogLevel.DEBUG
     ctx = Context.from_args(args, "context")
     assert ctx.log_level == DEBUG
+
+
+def test_context_from_args_reuses_class() -> None:
+    def make(**kwargs: object) -> Context:
+        args = Namespace(log_level=LogLevel.INFO, **kwargs)
+        return Context.from_args(args, "context", log_args=False)
+
+    ctx0 = make(foo=1, bar="a")
+    ctx1 = make(foo=2, bar="b")
+    assert type(ctx0) is type(ctx1)
+    assert not hasattr(ctx0, "__dict__")
+    assert getattr(ctx1, "foo") == 2
+
+    ctx2 = make(foo="1", bar="a")
+    assert type(ctx2) is not type(ctx0)
@@ -0,0 +1,75 @@
+from colorama import Fore, Style
+from io import StringIO
+from rpycli.cprint import ColourWriter, cprint
+import pytest
+import sys
+
+
+class TtyStringIO(StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def test_cprint() -> None:
+    f = TtyStringIO()
+    cprint(Fore.RED, "a", 1, file=f)
+    cprint(Fore.GREEN, "b", "c", sep="-", end="", file=f)
+    assert f.getvalue() == \
+        Fore.RED + "a 1\n" + Style.RESET_ALL + \
+        Fore.GREEN + "b-c" + Style.RESET_ALL
+
+
+def test_cprint_not_tty() -> None:
+    f = StringIO()
+    cprint(Fore.RED, "a", 1, file=f)
+    assert f.getvalue() == "a 1\n"
+
+
+def test_colour_writer() -> None:
+    f = TtyStringIO()
+    with ColourWriter(file=f) as w:
+        assert w.colour
+        w.print(Fore.RED, "a")
+        w.print_row(["x", 1], colours=[Fore.GREEN, Fore.BLUE])
+        assert f.getvalue() == ""
+
+    assert f.getvalue() == \
+        Fore.RED + "a\n" + Style.RESET_ALL + \
+        Fore.GREEN + "x" + Style.RESET_ALL + " " + \
+        Fore.BLUE + "1" + Style.RESET_ALL + "\n"
+
+
+def test_colour_writer_rows() -> None:
+    f = StringIO()
+    with ColourWriter(file=f) as w:
+        assert not w.colour
+        w.print_rows(
+            [["a", "bbb", "c"], ["dddd", "e", "f"]],
+            colours=[Fore.RED, Fore.GREEN],
+            sep=" | ",
+            align=True)
+
+    assert f.getvalue() == \
+        "a    | bbb | c\n" \
+        "dddd | e   | f\n"
+
+
+def test_colour_writer_buffer_size() -> None:
+    f = StringIO()
+    w = ColourWriter(file=f, colour=False, buffer_size=10)
+    w.print("", "12345")
+    assert f.getvalue() == ""
+    w.print("", "67890")
+    assert f.getvalue() == "12345\n67890\n"
+    w.print("", "x")
+    w.flush()
+    assert f.getvalue() == "12345\n67890\nx\n"
+
+
+def test_no_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "stdout", None)
+    cprint(Fore.RED, "a", flush=True)
+    with ColourWriter() as w:
+        assert not w.colour
+        w.print(Fore.RED, "a")
+        w.print_rows([["a", "b"]], colours=[])
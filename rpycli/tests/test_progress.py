@@ -0,0 +1,77 @@
+from io import StringIO
+from logging import ERROR
+from pathlib import Path
+from rpycli.fs import iter_files
+from rpycli.logger import Logger
+from rpycli.proc import proc_stream
+from rpycli.progress import Progress, format_bytes
+import sys
+
+
+def test_format_bytes() -> None:
+    assert format_bytes(0) == "0 B"
+    assert format_bytes(1023) == "1023 B"
+    assert format_bytes(1536) == "1.5 KiB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+    assert format_bytes(5 * 1024 ** 4) == "5.0 TiB"
+    assert format_bytes(5 * 1024 ** 5) == "5120.0 TiB"
+
+
+def test_progress_summary() -> None:
+    f = StringIO()
+    progress = Progress("scan", total=10, file=f, tty=False)
+    progress.count += 5
+    assert progress.eta() is not None
+    progress.render()
+    progress.render(final=True)
+
+    lines = f.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[-1].startswith("scan: 5/10, ")
+    assert "ETA " in lines[-1]
+
+
+def test_progress_tty() -> None:
+    f = StringIO()
+    progress = Progress("scan", file=f, tty=True)
+    progress.count += 3
+    progress.bytes += 2048
+    progress.render()
+    progress.render(final=True)
+
+    s = f.getvalue()
+    assert s.startswith("\r")
+    assert s.endswith("\n")
+    assert s.count("\r") == 2
+    assert s.count("\n") == 1
+    assert "scan: 3, 2.0 KiB, " in s
+
+
+def test_progress_context_manager() -> None:
+    f = StringIO()
+    with Progress("scan", file=f, tty=False, summary_interval=3600.0) as progress:
+        progress.count += 1
+
+    assert f.getvalue().startswith("scan: 1, ")
+    assert f.getvalue().count("\n") == 1
+
+
+def test_iter_files_progress(tmp_path: Path) -> None:
+    for name in ["a.txt", "b.bin", "c.txt"]:
+        (tmp_path / name).touch()
+
+    progress = Progress("scan", file=StringIO(), tty=False)
+    paths = list(iter_files(tmp_path, include_suffixes=[".txt"], progress=progress))
+    assert len(paths) == 2
+    assert progress.count == 2
+
+
+def test_proc_stream_progress() -> None:
+    logger = Logger("test-progress", ERROR)
+    progress = Progress("proc", file=StringIO(), tty=False)
+    command = [sys.executable, "-c", "print('a'); print('bb')"]
+    with proc_stream(logger=logger, op="test", command=command, dry_run=False, progress=progress) as (_, lines):
+        assert [line.rstrip() for line in lines] == ["a", "bb"]
+
+    assert progress.count == 2
+    assert progress.bytes >= 5
@@ -0,0 +1,264 @@
+from contextlib import contextmanager
+from pathlib import Path
+from rpycli.server import DEFAULT_CONNECT_TIMEOUT, default_socket_path, forward, serve
+from typing import Callable, Generator, Iterator
+import os
+import pytest
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"),
+    reason="requires Unix domain sockets and fork")
+
+
+def main(cwd: Path, argv: list[str]) -> int:
+    print(f"cwd={cwd} argv={argv} foo={os.getenv('RPYCLI_TEST_FOO')}")
+    match argv:
+        case ["fail"]: sys.exit(7)
+        case ["raise"]: raise RuntimeError("oops")
+        case ["sleep"]:
+            try:
+                for i in range(50):
+                    print(f"tick {i}", flush=True)
+                    time.sleep(0.1)
+            except KeyboardInterrupt:
+                return 130
+            return 0
+        case _: return 0
+
+
+@contextmanager
+def run_server(socket_path: Path, before_serve: Callable[[], None] | None = None, wait: bool = True) -> Generator[Path, None, None]:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            if before_serve is not None:
+                before_serve()
+            serve(
+                main,
+                socket_path=socket_path,
+                watch_paths=[],
+                init=False,
+                poll_interval=0.1,
+                handshake_timeout=0.2)
+        finally:
+            os._exit(1)
+
+    try:
+        for _ in range(100 if wait else 0):
+            if socket_path.exists():
+                break
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+
+def forward_null(socket_path: Path, *argv: str, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> int:
+    with open(os.devnull, "rb") as stdin, open(os.devnull, "wb") as stdout:
+        return forward(
+            socket_path,
+            argv=["prog", *argv],
+            stdio=(stdin.fileno(), stdout.fileno(), stdout.fileno()),
+            connect_timeout=connect_timeout)
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[Path]:
+    with run_server(tmp_path / "server.sock") as socket_path:
+        yield socket_path
+
+
+def test_forward(socket_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def call(*argv: str) -> tuple[int, str]:
+        output_path = tmp_path / "output.txt"
+        with open(os.devnull, "rb") as stdin, output_path.open("wb") as stdout:
+            exit_code = forward(
+                socket_path,
+                argv=["prog", *argv],
+                stdio=(stdin.fileno(), stdout.fileno(), stdout.fileno()))
+        return exit_code, output_path.read_text()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RPYCLI_TEST_FOO", "bar")
+
+    exit_code, output = call("a", "b")
+    assert exit_code == 0
+    assert output == f"cwd={tmp_path} argv=['a', 'b'] foo=bar\n"
+
+    exit_code, _ = call("fail")
+    assert exit_code == 7
+
+    exit_code, output = call("raise")
+    assert exit_code == 1
+    assert "RuntimeError: oops" in output
+
+
+def test_socket_mode(socket_path: Path) -> None:
+    assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+
+def test_stalled_client(socket_path: Path) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+        stalled.connect(str(socket_path))
+        assert forward_null(socket_path) == 0
+
+
+def test_request_os_error(tmp_path: Path) -> None:
+    def fail_first_fork() -> None:
+        fork = os.fork
+        failed = False
+
+        def patched_fork() -> int:
+            nonlocal failed
+            if not failed:
+                failed = True
+                raise BlockingIOError("fork failed")
+            return fork()
+
+        setattr(os, "fork", patched_fork)
+
+    with run_server(tmp_path / "server.sock", before_serve=fail_first_fork) as socket_path:
+        with pytest.raises(ConnectionError):
+            forward_null(socket_path)
+        assert forward_null(socket_path) == 0
+
+
+SERVER_SCRIPT: str = """
+from pathlib import Path
+from rpycli.server import serve
+import sys
+
+
+def main(cwd, argv):
+    print("{version}")
+
+
+if __name__ == "__main__":
+    serve(main, Path(sys.argv[1]), watch_paths=[Path(__file__)], init=False, poll_interval=0.05)
+"""
+
+
+def test_restart_keeps_socket(tmp_path: Path) -> None:
+    script_path = tmp_path / "server.py"
+    socket_path = tmp_path / "server.sock"
+    output_path = tmp_path / "output.txt"
+    script_path.write_text(SERVER_SCRIPT.format(version="v1"))
+
+    def call() -> str:
+        with open(os.devnull, "rb") as stdin, output_path.open("wb") as stdout:
+            exit_code = forward(
+                socket_path,
+                argv=["prog"],
+                stdio=(stdin.fileno(), stdout.fileno(), stdout.fileno()),
+                connect_timeout=0.0)
+        assert exit_code == 0
+        return output_path.read_text().strip()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(Path(__file__).parents[2])
+    with subprocess.Popen([sys.executable, str(script_path), str(socket_path)], env=env) as proc:
+        try:
+            for _ in range(100):
+                if socket_path.exists():
+                    break
+                time.sleep(0.05)
+            assert call() == "v1"
+
+            script_path.write_text(SERVER_SCRIPT.format(version="v2"))
+            st = script_path.stat()
+            os.utime(script_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            outputs: list[str] = []
+            for _ in range(200):
+                outputs.append(call())
+                if outputs[-1] == "v2":
+                    break
+                time.sleep(0.01)
+            assert outputs[-1] == "v2"
+        finally:
+            proc.terminate()
+
+
+def test_forward_retries_connect(tmp_path: Path) -> None:
+    socket_path = tmp_path / "server.sock"
+    with pytest.raises(FileNotFoundError):
+        forward_null(socket_path, connect_timeout=0.05)
+
+    with run_server(socket_path, before_serve=lambda: time.sleep(0.3), wait=False):
+        assert forward_null(socket_path) == 0
+
+
+CLIENT_SCRIPT: str = """
+from pathlib import Path
+from rpycli.server import forward
+import sys
+
+sys.exit(forward(Path(sys.argv[1]), argv=["prog", "sleep"]))
+"""
+
+
+def start_sleeping_client(socket_path: Path, output_path: Path, stderr_path: Path) -> subprocess.Popen[bytes]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(Path(__file__).parents[2])
+    with output_path.open("wb") as stdout, stderr_path.open("wb") as stderr:
+        proc = subprocess.Popen(
+            [sys.executable, "-c", CLIENT_SCRIPT, str(socket_path)],
+            stdout=stdout,
+            stderr=stderr,
+            env=env)
+
+    for _ in range(100):
+        if "tick 1" in output_path.read_text():
+            break
+        time.sleep(0.05)
+    assert "tick 1" in output_path.read_text()
+    return proc
+
+
+def assert_stopped(output_path: Path) -> None:
+    time.sleep(0.3)
+    size = output_path.stat().st_size
+    time.sleep(0.5)
+    assert output_path.stat().st_size == size
+    assert "tick 49" not in output_path.read_text()
+
+
+@pytest.mark.parametrize("signum, exit_code", [
+    (signal.SIGINT, 130),
+    (signal.SIGTERM, 143),
+])
+def test_forward_signal(socket_path: Path, tmp_path: Path, signum: signal.Signals, exit_code: int) -> None:
+    output_path = tmp_path / "output.txt"
+    stderr_path = tmp_path / "stderr.txt"
+    proc = start_sleeping_client(socket_path, output_path, stderr_path)
+    proc.send_signal(signum)
+    assert proc.wait(timeout=5) == exit_code
+    assert stderr_path.read_text() == ""
+    assert_stopped(output_path)
+
+
+def test_client_killed(socket_path: Path, tmp_path: Path) -> None:
+    output_path = tmp_path / "output.txt"
+    proc = start_sleeping_client(socket_path, output_path, tmp_path / "stderr.txt")
+    proc.kill()
+    proc.wait(timeout=5)
+    assert_stopped(output_path)
+
+
+def test_default_socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_path = default_socket_path("mytool")
+    assert socket_path == tmp_path / "rpycli" / "mytool.sock"
+    assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+
+    socket_path.parent.chmod(0o755)
+    with pytest.raises(RuntimeError):
+        default_socket_path("mytool")
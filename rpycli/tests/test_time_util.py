@@ -0,0 +1,63 @@
+from datetime import timedelta
+from rpycli.time_util import \
+    format_duration, \
+    iter_durations, \
+    parse_duration, \
+    parse_duration_seconds, \
+    parse_durations
+import math
+import pytest
+
+
+def test_parse_duration() -> None:
+    assert parse_duration("N/A") is None
+    assert parse_duration("1:02:03.5") == timedelta(hours=1, minutes=2, seconds=3.5)
+    assert parse_duration("02:03") == timedelta(minutes=2, seconds=3)
+    assert parse_duration("3.25") == timedelta(seconds=3.25)
+
+    with pytest.raises(ValueError):
+        parse_duration("1:2:3:4")
+
+
+def test_parse_duration_seconds() -> None:
+    assert parse_duration_seconds("N/A") is None
+    assert parse_duration_seconds("1:02:03.5") == 3723.5
+    assert parse_duration_seconds("02:03") == 123.0
+    assert parse_duration_seconds("3.25") == 3.25
+
+    with pytest.raises(ValueError):
+        parse_duration_seconds("1:2:3:4")
+
+
+def test_parse_durations() -> None:
+    values, mask = parse_durations(
+        ["1:00:00", "N/A", "0:01.5"],
+        use_numpy=False)
+    assert list(mask) == [0, 1, 0]
+    assert values[0] == 3600.0
+    assert math.isnan(values[1])
+    assert values[2] == 1.5
+
+
+def test_parse_durations_numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+    values, mask = parse_durations(["1:00:00", "N/A"], use_numpy=True)
+    assert isinstance(values, numpy.ndarray)
+    assert list(mask) == [False, True]
+    assert values[0] == 3600.0
+
+
+def test_iter_durations() -> None:
+    lines = ["0:00:01\n", "\n", "N/A\n", "2.5\n"]
+    assert list(iter_durations(lines)) == [1.0, None, 2.5]
+
+
+def test_format_duration() -> None:
+    assert format_duration(None) == "N/A"
+    assert format_duration(float("nan")) == "N/A"
+    assert format_duration(0.0) == "0:00:00"
+    assert format_duration(3723.5) == "1:02:03.500000"
+    assert format_duration(-61.0) == "-0:01:01"
+    assert format_duration(90000.0) == "25:00:00"
+    for seconds in [0.0, 1.25, 59.999999, 3723.5, 86399.0]:
+        assert format_duration(seconds) == str(timedelta(seconds=seconds))
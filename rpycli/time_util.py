@@ -1,8 +1,14 @@
+from array import array
 from datetime import timedelta
+from importlib import import_module
+from typing import Any, Iterable, Iterator, Tuple
+
+
+NOT_AVAILABLE: str = "N/A"
 
 
 def parse_duration(s: str) -> timedelta | None:
-    if s == "N/A":
+    if s == NOT_AVAILABLE:
         return None
 
     match tuple(map(float, s.split(":"))):
@@ -13,3 +19,59 @@ def parse_duration(s: str) -> timedelta | None:
         case (seconds,):
             return timedelta(seconds=seconds)
         case _: raise ValueError(f"Invalid duration string {s}")
+
+
+def parse_duration_seconds(s: str) -> float | None:
+    if s == NOT_AVAILABLE:
+        return None
+
+    parts = s.split(":")
+    match len(parts):
+        case 3: return float(parts[0]) * 3600.0 + float(parts[1]) * 60.0 + float(parts[2])
+        case 2: return float(parts[0]) * 60.0 + float(parts[1])
+        case 1: return float(s)
+        case _: raise ValueError(f"Invalid duration string {s}")
+
+
+def parse_durations(ss: Iterable[str], use_numpy: bool | None = None) -> Tuple[Any, Any]:
+    values = array("d")
+    mask = array("b")
+    for s in ss:
+        seconds = parse_duration_seconds(s)
+        if seconds is None:
+            values.append(float("nan"))
+            mask.append(1)
+        else:
+            values.append(seconds)
+            mask.append(0)
+
+    if use_numpy is None or use_numpy:
+        try:
+            numpy: Any = import_module("numpy")
+        except ImportError:
+            if use_numpy:
+                raise
+            return values, mask
+        return numpy.frombuffer(values, dtype=numpy.float64), numpy.frombuffer(mask, dtype=numpy.bool_)
+
+    return values, mask
+
+
+def iter_durations(lines: Iterable[str]) -> Iterator[float | None]:
+    for line in lines:
+        s = line.strip()
+        if len(s) > 0:
+            yield parse_duration_seconds(s)
+
+
+def format_duration(seconds: float | None) -> str:
+    if seconds is None or seconds != seconds:
+        return NOT_AVAILABLE
+
+    sign = "-" if seconds < 0 else ""
+    minutes, us = divmod(round(abs(seconds) * 1_000_000), 60_000_000)
+    hours, minutes = divmod(minutes, 60)
+    s, us = divmod(us, 1_000_000)
+    if us == 0:
+        return f"{sign}{hours}:{minutes:02}:{s:02}"
+    return f"{sign}{hours}:{minutes:02}:{s:02}.{us:06}"